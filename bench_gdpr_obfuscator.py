@@ -0,0 +1,131 @@
+"""
+Benchmark for the gdpr_obfuscator CSV path.
+
+This script splits the wall-clock time of obfuscating a synthetic CSV file into its
+stages (S3 GET, body read, header and body parse, mask and serialize), so optimisation
+work can target the stage that dominates. S3 is mocked with moto, so the GET and read
+timings measure the boto3 client overhead rather than network latency. The parse, mask and serialize
+stages call the helpers obfuscate_csv itself uses, and the end-to-end timings of the
+streaming and in-memory CSV functions are reported alongside them.
+
+Run it with:
+    python bench_gdpr_obfuscator.py [rows]
+"""
+
+import os
+import sys
+import time
+import boto3
+from moto import mock_aws
+from gdpr_obfuscator import (
+    obfuscate_csv,
+    obfuscate_csv_stream,
+    _mask_csv_table,
+    _read_csv_header,
+    _read_csv_table,
+    _write_csv_table,
+)
+
+REGION = "eu-west-2"
+BUCKET = "benchmark-bucket"
+KEY = "benchmark.csv"
+PII_FIELDS = frozenset({"name", "email_address"})
+DEFAULT_ROWS = 100_000
+
+
+def make_csv(rows: int) -> bytes:
+    """
+    Builds a synthetic CSV file in the format of the README example.
+
+    Args:
+        rows (int): The number of data rows.
+
+    Returns:
+        bytes: The CSV content as UTF-8 bytes.
+    """
+    lines = ["student_id,name,course,cohort,graduation_date,email_address\n"]
+    lines.extend(
+        f"{i},Student {i},Software,2024-03-31,2024-06-30,student{i}@email.com\n"
+        for i in range(rows)
+    )
+    return "".join(lines).encode("utf-8")
+
+
+def timed(stage: str, timings: list, func, *args):
+    """
+    Calls a function and records how long it took.
+
+    Args:
+        stage (str): The name to report the timing under.
+        timings (list): The list of (stage, nanoseconds) pairs to append to.
+        func: The function to call.
+        *args: The arguments to call it with.
+
+    Returns:
+        The function's return value.
+    """
+    start = time.perf_counter_ns()
+    result = func(*args)
+    timings.append((stage, time.perf_counter_ns() - start))
+    return result
+
+
+def run(rows: int) -> list:
+    """
+    Times each stage of obfuscating a synthetic CSV file stored in a mocked S3 bucket.
+
+    Args:
+        rows (int): The number of data rows in the CSV file.
+
+    Returns:
+        list: (stage, nanoseconds) pairs in the order the stages ran.
+    """
+    data = make_csv(rows)
+    timings = []
+    with mock_aws():
+        s3 = boto3.client("s3", region_name=REGION)
+        s3.create_bucket(
+            Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": REGION}
+        )
+        s3.put_object(Bucket=BUCKET, Key=KEY, Body=data)
+
+        # Split the in-memory path into its stages.
+        response = timed(
+            "S3 GET", timings, lambda: s3.get_object(Bucket=BUCKET, Key=KEY)
+        )
+        body = timed("read body", timings, response["Body"].read)
+        fieldnames = timed("parse header", timings, _read_csv_header, body)
+        table = timed("parse", timings, _read_csv_table, body, fieldnames)
+        table = timed("mask", timings, _mask_csv_table, table, PII_FIELDS)
+        timed("serialize", timings, _write_csv_table, table)
+
+        # Time the library's CSV functions end to end for comparison.
+        timed("obfuscate_csv (total)", timings, obfuscate_csv, body, PII_FIELDS)
+        stream = s3.get_object(Bucket=BUCKET, Key=KEY)["Body"]
+        timed(
+            "obfuscate_csv_stream (total)",
+            timings,
+            obfuscate_csv_stream,
+            stream,
+            PII_FIELDS,
+        )
+    return timings
+
+
+def main():
+    """
+    Runs the benchmark and prints a table of the stage timings.
+    """
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    # moto needs credentials to sign requests, even though none are checked.
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        os.environ.setdefault(name, "testing")
+
+    print(f"Obfuscating a {rows:,}-row CSV file")
+    print(f"{'stage':<36}{'ms':>10}")
+    for stage, elapsed in run(rows):
+        print(f"{stage:<36}{elapsed / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,18 +10,102 @@ the S3 file location and the fields to obfuscate.
 
 import csv
 import io
+import itertools
 import json
+import math
+import os
+import re
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import lru_cache
 from io import BytesIO
-import pandas as pd
+import ijson
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 
+# S3 URL in the form s3://bucket/key, capturing the bucket and the key.
+_S3_URL_RE = re.compile(r"s3://([^/]+)/(.+)", re.DOTALL)
 
-def obfuscate_csv(data: str, pii_fields: list) -> bytes:
+# Bytes that stop a CSV file from being written back by Arrow unchanged apart from its
+# PII columns: quotes, carriage returns, and blank lines. Each is a separate literal
+# pattern, which re searches for much faster than a single alternation.
+_CSV_NOT_PLAIN_RES = tuple(re.compile(pattern) for pattern in (b'"', b"\r", b"\n\n"))
+
+# A run of digits long enough to be an integer wider than 64 bits, which orjson reads
+# as a float, searched for in content translated so every digit becomes b"0" and every
+# other byte a space. A literal search of the translated copy is several times faster
+# than a regex like \d{19,}. It may also match inside a string or a float, which is
+# harmless.
+_DIGITS_TABLE = bytes(48 if 48 <= byte <= 57 else 32 for byte in range(256))
+_LONG_INTEGER_DIGITS = b"0" * 19
+
+# Endpoint URL of AWS's own S3 service, as opposed to a custom endpoint.
+_AWS_ENDPOINT_RE = re.compile(r"https://s3[.-]([a-z0-9-]+\.)*amazonaws\.com(\.cn)?/?$")
+
+# Objects at least this large are downloaded with parallel ranged GETs.
+PARALLEL_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+
+# Number of parts of a large object downloaded at once.
+TRANSFER_MAX_CONCURRENCY = 10
+
+# Transfer settings for parallel downloads, using the 8 MiB part size S3 recommends.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=TRANSFER_MAX_CONCURRENCY,
+)
+
+# Number of files obfuscate_files processes at once by default.
+DEFAULT_MAX_WORKERS = 32
+
+# Connections kept open by the shared S3 client: enough for every default
+# obfuscate_files worker to be downloading a large object in parallel parts, rather
+# than botocore's default of 10.
+S3_MAX_POOL_CONNECTIONS = DEFAULT_MAX_WORKERS * TRANSFER_MAX_CONCURRENCY
+
+# S3 client shared by every call, created on first use by _get_s3_client.
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+# Size of the reads made from a streamed S3 body.
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+# The obfuscated value in the PyArrow forms used to build masked columns, created once.
+_MASK_SCALAR = pa.scalar("***", pa.string())
+_MASK_DICTIONARY = pa.array(["***"], pa.string())
+_MASK_INDEX = pa.scalar(0, pa.int32())
+_MASK_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+# Parquet codec for files with no row groups to take the source codecs from, and the
+# level used for every ZSTD column.
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+
+# Target size of a Parquet data page before it is compressed.
+PARQUET_DATA_PAGE_SIZE = 1024 * 1024
+
+
+def obfuscate_csv(data: bytes, pii_fields: list) -> bytes:
     """
     Obfuscates PII fields in CSV data.
 
+    Plain CSV content (no quotes, carriage returns or blank lines, ending in a newline)
+    is parsed and written with PyArrow's multithreaded CSV reader and writer. Any other
+    content, or content Arrow cannot parse (e.g. ragged rows), is processed by
+    obfuscate_csv_stream. Both produce the same output for the same input.
+
     Args:
-        data (str): The CSV file content as a string.
+        data (bytes): The CSV file content as UTF-8 bytes, a string, or a pyarrow.Buffer
+            (e.g. over a memory-mapped file).
         pii_fields (list): List of field names to obfuscate.
 
     Returns:
@@ -30,83 +114,925 @@ def obfuscate_csv(data: str, pii_fields: list) -> bytes:
     Raises:
         ValueError: If the CSV file has no header row.
     """
-    # Create input and output streams for processing CSV data.
-    input_stream = io.StringIO(data)
-    output_stream = io.StringIO()
+    # Work on bytes so Arrow parses the content without it being decoded up front.
+    if isinstance(data, str):
+        data = data.encode("utf-8")
 
-    # Use DictReader to parse CSV rows into dictionaries.
-    reader = csv.DictReader(input_stream)
-    fieldnames = reader.fieldnames
-    if fieldnames is None:
+    # Read the header row so every column can be kept as a plain string.
+    fieldnames = _read_csv_header(data)
+
+    # Return the content unchanged when no column needs obfuscating.
+    if frozenset(pii_fields).isdisjoint(fieldnames):
+        return bytes(data)
+
+    # Arrow writes every row unquoted and ending in a newline, which matches the input
+    # only for plain content; the search runs over the buffer without copying it.
+    view = memoryview(data)
+    if view[-1:] == b"\n" and not any(r.search(view) for r in _CSV_NOT_PLAIN_RES):
+        try:
+            return _obfuscate_csv_arrow(data, fieldnames, pii_fields)
+        except pa.ArrowInvalid:
+            pass
+    return obfuscate_csv_stream(pa.BufferReader(data), pii_fields)
+
+
+def _read_csv_header(data: bytes) -> list:
+    """
+    Reads the header row of CSV content held in memory.
+
+    The content is read through a zero-copy pyarrow.BufferReader rather than copied.
+
+    Args:
+        data (bytes): The CSV file content as UTF-8 bytes or a pyarrow.Buffer.
+
+    Returns:
+        list: The column names.
+
+    Raises:
+        ValueError: If the CSV file has no header row.
+    """
+    header_stream = io.TextIOWrapper(
+        pa.BufferReader(data), encoding="utf-8", newline=""
+    )
+    # A blank first line parses as an empty row, which is no header either.
+    fieldnames = next(csv.reader(header_stream), None)
+    if not fieldnames:
         raise ValueError("CSV file has no header row.")
+    return fieldnames
+
+
+def _obfuscate_csv_arrow(raw: bytes, fieldnames: list, pii_fields: list) -> bytes:
+    """
+    Obfuscates PII columns of a plain CSV file using a PyArrow Table.
+
+    The content must contain no quotes, carriage returns or blank lines, so the header
+    and rows can be written back unquoted exactly as they were read.
+
+    Args:
+        raw (bytes): The CSV file content as UTF-8 bytes.
+        fieldnames (list): The column names from the header row.
+        pii_fields (list): List of field names to obfuscate.
+
+    Returns:
+        bytes: The obfuscated CSV content as bytes.
+
+    Raises:
+        pyarrow.ArrowInvalid: If the CSV content cannot be parsed by Arrow.
+    """
+    table = _read_csv_table(raw, fieldnames)
+    table = _mask_csv_table(table, pii_fields)
+    return _write_csv_table(table)
+
+
+def _read_csv_table(raw: bytes, fieldnames: list) -> pa.Table:
+    """
+    Parses plain CSV content into a PyArrow Table of strings.
+
+    Args:
+        raw (bytes): The CSV file content as UTF-8 bytes.
+        fieldnames (list): The column names from the header row.
 
-    # Initialize a CSV writer with the same fieldnames.
-    writer = csv.DictWriter(
-        output_stream, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL
+    Returns:
+        pyarrow.Table: The rows after the header, with every column as a string.
+
+    Raises:
+        pyarrow.ArrowInvalid: If the CSV content cannot be parsed by Arrow.
+    """
+    # Parse every column as a string so values are written back exactly as read.
+    return pa_csv.read_csv(
+        pa.BufferReader(raw),
+        read_options=pa_csv.ReadOptions(column_names=fieldnames, skip_rows=1),
+        parse_options=pa_csv.ParseOptions(quote_char=False),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=dict.fromkeys(fieldnames, pa.string()),
+            strings_can_be_null=False,
+        ),
     )
-    writer.writeheader()
 
-    # Iterate over each row and obfuscate PII fields.
-    for row in reader:
-        for field in pii_fields:
-            if field in row:
-                row[field] = "***"
-        writer.writerow(row)
 
-    # Return the obfuscated CSV as bytes.
-    return output_stream.getvalue().encode("utf-8")
+def _mask_csv_table(table: pa.Table, pii_fields: list) -> pa.Table:
+    """
+    Replaces the PII columns of a table with obfuscated values.
 
+    Args:
+        table (pyarrow.Table): The parsed CSV content.
+        pii_fields (list): List of field names to obfuscate.
 
-def obfuscate_json(data: str, pii_fields: list) -> bytes:
+    Returns:
+        pyarrow.Table: The table with its PII columns obfuscated.
+    """
+    # Replace each PII column with one shared constant array of obfuscated values.
+    pii_set = frozenset(pii_fields)
+    masked = pa.repeat(_MASK_SCALAR, table.num_rows)
+    for i, name in enumerate(table.column_names):
+        if name in pii_set:
+            table = table.set_column(i, name, masked)
+    return table
+
+
+def _write_csv_table(table: pa.Table) -> bytes:
+    """
+    Writes a table of plain CSV values back to CSV bytes.
+
+    Args:
+        table (pyarrow.Table): The table to write, whose column names are the header.
+
+    Returns:
+        bytes: The CSV content as bytes.
+    """
+    # Write the header as it was read (Arrow always quotes it), then the rows unquoted.
+    out_buffer = BytesIO()
+    out_buffer.write(",".join(table.column_names).encode("utf-8") + b"\n")
+    pa_csv.write_csv(
+        table,
+        out_buffer,
+        write_options=pa_csv.WriteOptions(include_header=False, quoting_style="none"),
+    )
+    return out_buffer.getvalue()
+
+
+def obfuscate_csv_stream(body, pii_fields: list) -> bytes:
+    """
+    Obfuscates PII fields in CSV data read incrementally from a binary stream.
+
+    Rows are obfuscated and written one at a time, so only a single line of the input is
+    held in memory and processing overlaps with the stream being received. Lines are
+    rewritten as raw bytes until the first line containing a quote character or a
+    carriage return other than its line ending, after which the remaining rows are
+    decoded and handled by the csv module. Any other line holds exactly one row with no
+    escaped delimiters, so both approaches produce the same rows.
+
+    Args:
+        body: A readable binary file-like object (e.g. an S3 StreamingBody).
+        pii_fields (list): List of field names to obfuscate.
+
+    Returns:
+        bytes: The obfuscated CSV content as bytes.
+
+    Raises:
+        ValueError: If the CSV file has no header row.
+    """
+    # Buffer the body in large reads, so the header line is not read byte by byte.
+    body = io.BufferedReader(body, buffer_size=STREAM_BUFFER_SIZE)
+
+    # Read the header line to check whether any column needs obfuscating at all.
+    # An empty body has no header; csv.reader would parse it as an empty row.
+    header_line = body.readline()
+    if not header_line:
+        raise ValueError("CSV file has no header row.")
+
+    # Rows rewritten by the csv module end with the same line ending as the header.
+    ending = "\r\n" if header_line.endswith(b"\r\n") else "\n"
+
+    # A header line with an odd number of quotes ends inside a quoted name and continues
+    # on the next line, and a bare carriage return ends the header early, so either is
+    # left entirely to the csv module.
+    out_buffer = BytesIO()
+    if header_line.count(b'"') % 2 or b"\r" in _strip_line_ending(header_line):
+        lines = itertools.chain(_split_lines(header_line), _utf8_reader(body))
+        _mask_csv_rows(lines, out_buffer, pii_fields, lineterminator=ending)
+        return out_buffer.getvalue()
+
+    # Return the content unchanged when no column needs obfuscating.
+    fieldnames = next(csv.reader([header_line.decode("utf-8")]))
+    if not fieldnames:
+        raise ValueError("CSV file has no header row.")
+    pii_set = frozenset(pii_fields)
+    if pii_set.isdisjoint(fieldnames):
+        return header_line + body.read()
+
+    # Fast path: obfuscate unquoted lines as bytes, keeping their line endings.
+    out_buffer.write(header_line)
+    pii_idx = tuple(i for i, name in enumerate(fieldnames) if name in pii_set)
+    last_idx = pii_idx[-1]
+    for line in body:
+        # A bare carriage return ends a row for the csv module, so a line holding one
+        # is handed over with the quoted lines.
+        content = _strip_line_ending(line)
+        if b'"' in line or b"\r" in content:
+            lines = itertools.chain(_split_lines(line), _utf8_reader(body))
+            _mask_csv_rows(lines, out_buffer, pii_fields, fieldnames, ending)
+            break
+        if content:
+            cells = content.split(b",")
+            if len(cells) > last_idx:
+                for i in pii_idx:
+                    cells[i] = b"***"
+            else:
+                _mask_short_row(cells, pii_idx, b"***")
+            line = b",".join(cells) + line[len(content) :]
+        out_buffer.write(line)
+    return out_buffer.getvalue()
+
+
+def _utf8_reader(body) -> io.TextIOWrapper:
+    """
+    Wraps a binary stream in a text stream that decodes its remaining UTF-8 content.
+
+    The content is decoded in large blocks as it is read, rather than decoding the whole
+    body up front or one line at a time. Newlines are passed through untranslated, as the
+    csv module requires.
+
+    Args:
+        body: A readable binary file-like object.
+
+    Returns:
+        io.TextIOWrapper: A text stream reading from the binary stream.
+    """
+    return io.TextIOWrapper(body, encoding="utf-8", newline="")
+
+
+def _utf8_writer(out_buffer: BytesIO) -> io.TextIOWrapper:
+    """
+    Wraps a bytes buffer in a text stream that encodes writes to it immediately.
+
+    Writing CSV text through this avoids building the output as a string and encoding
+    it afterwards. Detach the wrapper when done so the buffer is not closed with it.
+
+    Args:
+        out_buffer (BytesIO): The buffer to write the UTF-8 encoded text to.
+
+    Returns:
+        io.TextIOWrapper: A text stream writing to the buffer.
+    """
+    return io.TextIOWrapper(
+        out_buffer, encoding="utf-8", newline="", write_through=True
+    )
+
+
+def _strip_line_ending(line: bytes) -> bytes:
+    """
+    Removes the line ending read with a line of CSV content.
+
+    Only a trailing newline, or a carriage return directly before it, is removed; any
+    other carriage return is left in place.
+
+    Args:
+        line (bytes): A line as read from a binary stream.
+
+    Returns:
+        bytes: The line without its line ending.
+    """
+    if line.endswith(b"\r\n"):
+        return line[:-2]
+    if line.endswith(b"\n"):
+        return line[:-1]
+    return line
+
+
+def _split_lines(line: bytes):
+    """
+    Decodes a line of CSV content already read from a binary stream.
+
+    The line is split at bare carriage returns as well, as the csv module only accepts
+    them at the end of each line it is given.
+
+    Args:
+        line (bytes): A line as read from a binary stream.
+
+    Returns:
+        io.StringIO: An iterator of the line's text lines.
+    """
+    return io.StringIO(line.decode("utf-8"), newline="")
+
+
+def _mask_csv_rows(
+    lines, out_buffer: BytesIO, pii_fields: list, fieldnames=None, lineterminator="\r\n"
+) -> None:
+    """
+    Obfuscates PII fields row by row using the csv module.
+
+    Args:
+        lines: An iterator of the remaining lines of the CSV content, as text.
+        out_buffer (BytesIO): The buffer to write the obfuscated CSV content to.
+        pii_fields (list): List of field names to obfuscate.
+        fieldnames (list, optional): The header row, if it has already been written.
+            Otherwise the header is read from the first line and written unchanged.
+        lineterminator (str): The line ending to write after each row.
+
+    Raises:
+        ValueError: If the header is to be read and the first row is empty.
+    """
+    reader = csv.reader(lines)
+    output_stream = _utf8_writer(out_buffer)
+    writer = csv.writer(
+        output_stream, quoting=csv.QUOTE_MINIMAL, lineterminator=lineterminator
+    )
+    quoting_writer = None
+    if "\r" not in lineterminator:
+        quoting_writer = csv.writer(
+            output_stream, quoting=csv.QUOTE_ALL, lineterminator=lineterminator
+        )
+    if fieldnames is None:
+        fieldnames = next(reader, None)
+        if not fieldnames:
+            raise ValueError("CSV file has no header row.")
+        _write_csv_rows([fieldnames], writer, quoting_writer)
+
+    # Resolve the PII fields to column indices once, rather than per row. Rows longer
+    # than the last index hold every PII column and need no bounds checks.
+    pii_set = frozenset(pii_fields)
+    pii_idx = tuple(i for i, name in enumerate(fieldnames) if name in pii_set)
+    last_idx = pii_idx[-1] if pii_idx else -1
+
+    # Obfuscate the PII columns of each row by index.
+    rows = (_mask_row(row, pii_idx, last_idx) for row in reader)
+    _write_csv_rows(rows, writer, quoting_writer)
+    output_stream.detach()
+
+
+def _write_csv_rows(rows, writer, quoting_writer=None) -> None:
+    """
+    Writes CSV rows, quoting every field of a row that holds a bare carriage return.
+
+    csv.writer quotes only the characters of its own line terminator, so with a "\n"
+    terminator a carriage return would be written unquoted and read back as the end of
+    a row.
+
+    Args:
+        rows: An iterable of rows.
+        writer: The csv writer for other rows.
+        quoting_writer: A csv writer quoting every field, used for rows holding a
+            carriage return, or None if writer already quotes them.
+    """
+    if quoting_writer is None:
+        writer.writerows(rows)
+        return
+    for row in rows:
+        if "\r" in "".join(row):
+            quoting_writer.writerow(row)
+        else:
+            writer.writerow(row)
+
+
+def _mask_row(row: list, pii_idx: tuple, last_idx: int) -> list:
+    """
+    Obfuscates the PII columns of a parsed CSV row.
+
+    Args:
+        row (list): The row's field values, modified in place.
+        pii_idx (tuple): The column indices to obfuscate.
+        last_idx (int): The highest index in pii_idx, or -1 if it is empty.
+
+    Returns:
+        list: The same row, for use in a generator.
+    """
+    if len(row) > last_idx:
+        for i in pii_idx:
+            row[i] = "***"
+    else:
+        _mask_short_row(row, pii_idx, "***")
+    return row
+
+
+def _mask_short_row(row: list, pii_idx: tuple, mask) -> None:
+    """
+    Obfuscates the PII columns present in a row with fewer fields than the header.
+
+    Args:
+        row (list): The row's field values, modified in place.
+        pii_idx (tuple): The column indices to obfuscate.
+        mask (str | bytes): The obfuscated value, of the same type as the fields.
+    """
+    for i in pii_idx:
+        if i < len(row):
+            row[i] = mask
+
+
+def obfuscate_json(data: bytes, pii_fields: list) -> bytes:
     """
     Obfuscates PII fields in JSON data.
 
     Args:
-        data (str): The JSON file content as a string (assumed to be a list of dictionaries).
+        data (bytes): The JSON file content as bytes or a string (assumed to be a list of
+            dictionaries).
         pii_fields (list): List of field names to obfuscate.
 
     Returns:
         bytes: The obfuscated JSON content as bytes.
+
+    Raises:
+        ValueError: If the JSON content is malformed or not a list of dictionaries.
     """
-    # Parse the JSON string into a Python object.
-    data_list = json.loads(data)
+    # Parse the JSON content into a Python object. orjson would turn integers wider
+    # than 64 bits into floats, so content that may hold one is parsed by json instead.
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if _LONG_INTEGER_DIGITS in data.translate(_DIGITS_TABLE):
+        data_list = json.loads(data)
+    else:
+        data_list = orjson.loads(data)
+
+    if not isinstance(data_list, list):
+        raise ValueError("JSON file must contain a list of objects.")
 
-    # Iterate through each dictionary in the list and obfuscate PII fields.
+    # Iterate through each dictionary in the list and obfuscate the PII fields present,
+    # found by a C-level intersection of its keys with the PII set.
+    pii_set = frozenset(pii_fields)
     for row in data_list:
-        for field in pii_fields:
-            if field in row:
+        if not isinstance(row, dict):
+            raise ValueError("JSON file must contain a list of objects.")
+        for field in row.keys() & pii_set:
+            row[field] = "***"
+
+    # Dump the modified data back to JSON bytes.
+    return _dump_json(data_list)
+
+
+def _dump_json(obj) -> bytes:
+    """
+    Serialises a parsed JSON value to compact JSON bytes.
+
+    orjson is used where it can represent every value; integers wider than 64 bits are
+    written by the json module instead, in the same compact format, so they are kept
+    exactly rather than rejected. Decimals (from ijson) are written as floats.
+
+    Args:
+        obj: The value to serialise.
+
+    Returns:
+        bytes: The JSON content as UTF-8 bytes.
+    """
+    try:
+        return orjson.dumps(obj, default=_json_default)
+    except TypeError:
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+
+
+def _json_default(obj):
+    """
+    Converts values the JSON serialisers do not support natively.
+
+    Args:
+        obj: The value to convert.
+
+    Returns:
+        float: The value of a Decimal, as json.loads would have parsed it.
+
+    Raises:
+        ValueError: If the Decimal is too large to be a finite float, as it would
+            otherwise be written as null or Infinity.
+        TypeError: If the value is not a Decimal.
+    """
+    if isinstance(obj, Decimal):
+        value = float(obj)
+        if not math.isfinite(value):
+            raise ValueError(f"JSON number is out of range: {obj}")
+        return value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def obfuscate_json_stream(body, pii_fields: list) -> bytes:
+    """
+    Obfuscates PII fields in JSON data read incrementally from a binary stream.
+
+    Records are parsed, obfuscated and written one at a time, so only a single record of
+    the input is held in memory rather than the whole parsed document. Numbers are
+    parsed exactly, so integers wider than 64 bits are kept as they were.
+
+    Args:
+        body: A readable binary file-like object (e.g. an S3 StreamingBody) containing a
+            JSON list of dictionaries.
+        pii_fields (list): List of field names to obfuscate.
+
+    Returns:
+        bytes: The obfuscated JSON content as bytes.
+
+    Raises:
+        ValueError: If the JSON content is malformed or not a list of dictionaries.
+    """
+    # Check the top level is a list before reading any record, as ijson would otherwise
+    # find no items in any other document and return an empty list.
+    body = io.BufferedReader(body, buffer_size=STREAM_BUFFER_SIZE)
+    leading = _skip_json_whitespace(body)
+    if body.peek(1)[:1] != b"[":
+        raise ValueError("JSON file must contain a list of objects.")
+
+    # Return the content unchanged when there are no fields to obfuscate.
+    pii_set = frozenset(pii_fields)
+    if not pii_set:
+        return leading + body.read()
+
+    out_buffer = BytesIO()
+    out_buffer.write(b"[")
+
+    # Iterate over each record in the top-level list and obfuscate the PII fields present.
+    # ijson's parse errors are not ValueErrors, so they are re-raised as one.
+    try:
+        for i, row in enumerate(ijson.items(body, "item", use_float=False)):
+            if not isinstance(row, dict):
+                raise ValueError("JSON file must contain a list of objects.")
+            if i:
+                out_buffer.write(b",")
+            for field in row.keys() & pii_set:
                 row[field] = "***"
+            out_buffer.write(_dump_json(row))
+    except ijson.JSONError as err:
+        raise ValueError(f"Invalid JSON file: {err}") from err
+
+    out_buffer.write(b"]")
+    return out_buffer.getvalue()
+
 
-    # Dump the modified data back to a JSON string and encode as bytes.
-    return json.dumps(data_list).encode("utf-8")
+def _skip_json_whitespace(body: io.BufferedReader) -> bytes:
+    """
+    Reads past the whitespace at the start of a JSON document.
+
+    Args:
+        body (io.BufferedReader): The stream to read from, left positioned at the first
+            non-whitespace byte.
+
+    Returns:
+        bytes: The whitespace that was skipped.
+    """
+    skipped = []
+    while True:
+        chunk = body.peek(1)
+        whitespace = len(chunk) - len(chunk.lstrip(b" \t\r\n"))
+        if whitespace:
+            skipped.append(body.read(whitespace))
+        if whitespace < len(chunk) or not chunk:
+            return b"".join(skipped)
 
 
 def obfuscate_parquet(file_bytes: bytes, pii_fields: list) -> bytes:
     """
     Obfuscates PII fields in a Parquet file.
 
+    The file is rewritten row group by row group across a thread pool. PII columns are
+    replaced without being read or decompressed, and every column keeps the compression
+    codec of the source file so downstream readers are unaffected.
+
     Args:
-        file_bytes (bytes): The Parquet file content as bytes.
+        file_bytes (bytes): The Parquet file content as bytes, or a random-access
+            pyarrow.NativeFile (e.g. from pyarrow.fs.S3FileSystem) to read it from.
         pii_fields (list): List of field names to obfuscate.
 
     Returns:
         bytes: The obfuscated Parquet file as bytes.
     """
-    # Read the Parquet file into a pandas DataFrame.
-    df = pd.read_parquet(BytesIO(file_bytes))
+    # Open the Parquet file and find the columns to obfuscate.
+    if isinstance(file_bytes, pa.NativeFile):
+        source = file_bytes
+    else:
+        source = pa.BufferReader(file_bytes)
+    parquet_file = pq.ParquetFile(source)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    pii_set = frozenset(pii_fields)
+    pii_idx = tuple(i for i, name in enumerate(schema.names) if name in pii_set)
+    other_columns = [name for name in schema.names if name not in pii_set]
 
-    # Replace the specified PII fields with an obfuscated value.
-    for field in pii_fields:
-        if field in df.columns:
-            df[field] = "***"
+    # A file with no PII columns, or whose PII columns are all masked already (e.g. a
+    # re-run over an obfuscated archive), is returned unchanged, judged from the
+    # footer metadata alone.
+    if all(_is_masked_column(metadata, schema.names[i]) for i in pii_idx):
+        if source is file_bytes:
+            return source.read_at(source.size(), 0)
+        return file_bytes
 
-    # Write the modified DataFrame back to a Parquet file in a BytesIO buffer.
-    out_buffer = BytesIO()
-    df.to_parquet(out_buffer, index=False)
-    return out_buffer.getvalue()
+    # PII columns become dictionary-encoded constants, which store "***" once plus an
+    # index per row.
+    for i in pii_idx:
+        schema = schema.set(i, pa.field(schema.names[i], _MASK_TYPE))
+
+    def obfuscate_row_group(rg: int):
+        # Read only the columns that are kept, then insert the masked PII columns.
+        # Each call opens its own reader over the source, whose positional reads are
+        # thread-safe, so row groups can be read concurrently.
+        reader = pq.ParquetFile(source, metadata=metadata)
+        num_rows = metadata.row_group(rg).num_rows
+        table = reader.read_row_group(rg, columns=other_columns)
+        masked = _masked_array(num_rows)
+        for i in pii_idx:
+            table = table.add_column(i, schema.field(i), masked)
+        return table
+
+    # Obfuscate row groups in a thread pool (PyArrow releases the GIL while decoding)
+    # and write them in their original order, keeping at most one per worker in flight.
+    workers = max(1, min(metadata.num_row_groups, os.cpu_count() or 1))
+    sink = pa.BufferOutputStream()
+    compression = _parquet_compression(metadata, pii_set)
+    with pq.ParquetWriter(
+        sink,
+        schema,
+        compression=compression,
+        compression_level=_parquet_compression_level(compression),
+        use_dictionary=True,
+        data_page_size=PARQUET_DATA_PAGE_SIZE,
+    ) as writer, ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for rg in range(metadata.num_row_groups):
+            pending.append(executor.submit(obfuscate_row_group, rg))
+            if len(pending) > workers:
+                table = pending.popleft().result()
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        while pending:
+            table = pending.popleft().result()
+            writer.write_table(table, row_group_size=max(table.num_rows, 1))
+    return sink.getvalue().to_pybytes()
+
+
+def _masked_array(num_rows: int) -> pa.DictionaryArray:
+    """
+    Builds a dictionary-encoded array of obfuscated values.
+
+    Args:
+        num_rows (int): The length of the array.
+
+    Returns:
+        pyarrow.DictionaryArray: An array whose every element is "***".
+    """
+    indices = pa.repeat(_MASK_INDEX, num_rows)
+    return pa.DictionaryArray.from_arrays(indices, _MASK_DICTIONARY)
+
+
+def _is_masked_column(metadata, name: str) -> bool:
+    """
+    Checks whether a Parquet column holds only obfuscated values, using its statistics.
+
+    Args:
+        metadata (pyarrow.parquet.FileMetaData): The metadata of the Parquet file.
+        name (str): The name of a top-level column.
+
+    Returns:
+        bool: True if every row group records "***" as both the minimum and maximum of
+            the column and no nulls, otherwise False.
+    """
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        if row_group.num_rows == 0:
+            continue
+        columns = (row_group.column(j) for j in range(row_group.num_columns))
+        column = next((c for c in columns if c.path_in_schema == name), None)
+        stats = column.statistics if column is not None else None
+        if (
+            stats is None
+            or not stats.has_min_max
+            or not stats.has_null_count
+            or stats.null_count != 0
+            or stats.min not in ("***", b"***")
+            or stats.max not in ("***", b"***")
+        ):
+            return False
+    return True
 
 
-def obfuscate_file(json_input_str: str) -> bytes:
+def _parquet_compression(metadata, pii_set: frozenset):
+    """
+    Determines the compression codec of each column in a Parquet file.
+
+    Args:
+        metadata (pyarrow.parquet.FileMetaData): The metadata of the source Parquet file.
+        pii_set (frozenset): The names of the columns being obfuscated.
+
+    Returns:
+        dict | str: A mapping of column paths to codecs for pyarrow.parquet.write_table,
+            or PARQUET_COMPRESSION if the file has no row groups to take the codecs from.
+    """
+    if metadata.num_row_groups == 0:
+        return PARQUET_COMPRESSION
+
+    # Parquet metadata and the PyArrow writer name some codecs differently.
+    codec_names = {"UNCOMPRESSED": "NONE", "LZ4_RAW": "LZ4"}
+
+    compression = {}
+    row_group = metadata.row_group(0)
+    for j in range(row_group.num_columns):
+        column = row_group.column(j)
+        codec = codec_names.get(column.compression, column.compression)
+        name = column.path_in_schema.split(".", 1)[0]
+        if name in pii_set:
+            # An obfuscated column is written as a single leaf under its own name.
+            compression.setdefault(name, codec)
+        else:
+            compression[column.path_in_schema] = codec
+    return compression
+
+
+def _parquet_compression_level(compression):
+    """
+    Determines the compression level for the columns of a Parquet file being written.
+
+    Only ZSTD columns are given a level, as the other codecs reject one.
+
+    Args:
+        compression (dict | str): The codecs returned by _parquet_compression.
+
+    Returns:
+        dict | int | None: A mapping of column paths to levels, a single level, or None.
+    """
+    if isinstance(compression, str):
+        return PARQUET_COMPRESSION_LEVEL if compression == "zstd" else None
+    return {
+        path: PARQUET_COMPRESSION_LEVEL
+        for path, codec in compression.items()
+        if codec == "ZSTD"
+    }
+
+
+@lru_cache(maxsize=256)
+def _parse_s3_url(s3_url: str) -> tuple:
+    """
+    Splits an S3 URL into its bucket and key.
+
+    Results are cached, as the same URLs tend to recur across retries and batches.
+    Invalid URLs raise every time, since exceptions are not cached.
+
+    Args:
+        s3_url (str): An S3 URL in the form s3://bucket/key.
+
+    Returns:
+        tuple: The bucket name and the object key.
+
+    Raises:
+        ValueError: If the URL is not a valid S3 URL.
+    """
+    match = _S3_URL_RE.fullmatch(s3_url)
+    if match is None:
+        if not s3_url.startswith("s3://"):
+            raise ValueError("Invalid S3 URL: Must start with 's3://'")
+        raise ValueError("Invalid S3 URL: Must be in the form s3://bucket/key")
+    return match.group(1), match.group(2)
+
+
+def _get_s3_client():
+    """
+    Returns the module's shared S3 client, creating it on first use.
+
+    Creating a boto3 client loads the botocore session and service models, so reusing
+    one across calls (e.g. in a warm Lambda container) avoids that cost and shares its
+    HTTPS connection pool.
+
+    Returns:
+        A boto3 S3 client.
+    """
+    global _S3_CLIENT  # pylint: disable=global-statement
+    if _S3_CLIENT is None:
+        # Lock so concurrent first calls (e.g. from obfuscate_files) build one client.
+        with _S3_CLIENT_LOCK:
+            if _S3_CLIENT is None:
+                _S3_CLIENT = boto3.client(
+                    "s3", config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
+                )
+    return _S3_CLIENT
+
+
+def _open_s3_object(s3, bucket: str, key: str, random_access: bool = False):
+    """
+    Opens an S3 object for reading.
+
+    The object is requested with a single GetObject call, whose body is streamed when
+    the object is small. For objects of at least PARALLEL_DOWNLOAD_THRESHOLD bytes the
+    body is closed unread and the object is instead downloaded into memory with
+    concurrent ranged GETs, as a single connection cannot saturate S3 throughput. If
+    random access is requested, a large object is opened through PyArrow's S3
+    filesystem instead, so the reader fetches only the byte ranges it needs.
+
+    Args:
+        s3: A boto3 S3 client.
+        bucket (str): The S3 bucket name.
+        key (str): The S3 object key.
+        random_access (bool): Whether the caller can read a pyarrow.NativeFile.
+
+    Returns:
+        A readable binary file-like object positioned at the start of the object.
+    """
+    response = s3.get_object(Bucket=bucket, Key=key)
+    if response["ContentLength"] < PARALLEL_DOWNLOAD_THRESHOLD:
+        return response["Body"]
+
+    # Fetch a large object in parallel parts rather than over a single stream, closing
+    # the unread body so its connection is not left open.
+    response["Body"].close()
+    if random_access:
+        return _s3_filesystem(s3).open_input_file(f"{bucket}/{key}")
+    buffer = BytesIO()
+    s3.download_fileobj(bucket, key, buffer, Config=TRANSFER_CONFIG)
+    buffer.seek(0)
+    return buffer
+
+
+def _s3_filesystem(s3) -> pa_fs.S3FileSystem:
+    """
+    Creates a PyArrow S3 filesystem configured like a boto3 S3 client.
+
+    The filesystem uses the client's region and the credentials boto3 resolves for the
+    environment, so objects read through it come from the same account as those read
+    by the client. A custom endpoint (e.g. a local S3-compatible service) is passed on
+    as well; AWS's own endpoints are left for Arrow to resolve, so it keeps its default
+    virtual-hosted-style addressing.
+
+    Args:
+        s3: A boto3 S3 client.
+
+    Returns:
+        pyarrow.fs.S3FileSystem: The filesystem.
+    """
+    options = {"region": s3.meta.region_name}
+    if not _AWS_ENDPOINT_RE.match(s3.meta.endpoint_url):
+        options["endpoint_override"] = s3.meta.endpoint_url
+    credentials = boto3.Session().get_credentials()
+    if credentials is not None:
+        frozen = credentials.get_frozen_credentials()
+        options.update(
+            access_key=frozen.access_key,
+            secret_key=frozen.secret_key,
+            session_token=frozen.token,
+        )
+    return pa_fs.S3FileSystem(**options)
+
+
+def _obfuscate_csv_body(body, pii_fields: list) -> bytes:
+    """
+    Obfuscates PII fields in a CSV file read from an S3 object body.
+
+    A streamed body is processed row by row as it arrives. A body already downloaded
+    into memory (see _open_s3_object) or memory-mapped from a local cache file is
+    obfuscated column-wise by obfuscate_csv, whose vectorised C++ parser is much faster
+    on large files. Both give the same output, so the format does not depend on size.
+
+    Args:
+        body: A readable binary file-like object (e.g. an S3 StreamingBody), a BytesIO
+            holding the whole object, or a pyarrow.MemoryMappedFile.
+        pii_fields (list): List of field names to obfuscate.
+
+    Returns:
+        bytes: The obfuscated CSV content as bytes.
+    """
+    if isinstance(body, BytesIO):
+        return obfuscate_csv(body.getvalue(), pii_fields)
+    if isinstance(body, pa.MemoryMappedFile):
+        return obfuscate_csv(body.read_buffer(), pii_fields)
+    return obfuscate_csv_stream(body, pii_fields)
+
+
+def _obfuscate_parquet_body(body, pii_fields: list) -> bytes:
+    """
+    Obfuscates PII fields in a Parquet file read from an S3 object body.
+
+    Parquet needs random access to its footer, so a streamed body is read into memory
+    first; a random-access pyarrow.NativeFile is read from directly.
+
+    Args:
+        body: A readable binary file-like object (e.g. an S3 StreamingBody), or a
+            pyarrow.NativeFile.
+        pii_fields (list): List of field names to obfuscate.
+
+    Returns:
+        bytes: The obfuscated Parquet file as bytes.
+    """
+    if isinstance(body, pa.NativeFile):
+        return obfuscate_parquet(body, pii_fields)
+    return obfuscate_parquet(body.read(), pii_fields)
+
+
+# Obfuscation function for each supported file extension, taking the S3 object body.
+_FILE_HANDLERS = {
+    ".csv": _obfuscate_csv_body,
+    ".json": obfuscate_json_stream,
+    ".parquet": _obfuscate_parquet_body,
+}
+
+# File extensions whose handlers can read a large object through random access.
+_RANDOM_ACCESS_EXTENSIONS = frozenset({".parquet"})
+
+
+def _obfuscate_cached_object(
+    s3, bucket: str, key: str, local_cache_dir: str, handler, pii_fields: list
+) -> bytes:
+    """
+    Downloads an S3 object to a local file and obfuscates it through a memory map.
+
+    The object is downloaded with concurrent ranged GETs into a temporary file in
+    local_cache_dir, which is then memory-mapped, so the OS pages the content in on
+    demand rather than it being copied onto the Python heap. The file is removed once
+    the object has been obfuscated.
+
+    Args:
+        s3: A boto3 S3 client.
+        bucket (str): The S3 bucket name.
+        key (str): The S3 object key.
+        local_cache_dir (str): The directory to create the temporary file in.
+        handler: The obfuscation function for the object's file type.
+        pii_fields (list): List of field names to obfuscate.
+
+    Returns:
+        bytes: The obfuscated file as bytes.
+    """
+    fd, path = tempfile.mkstemp(dir=local_cache_dir, suffix=os.path.splitext(key)[1])
+    try:
+        with os.fdopen(fd, "wb") as cache_file:
+            s3.download_fileobj(bucket, key, cache_file, Config=TRANSFER_CONFIG)
+        with pa.memory_map(path) as mapped:
+            return handler(mapped, pii_fields)
+    finally:
+        os.remove(path)
+
+
+def obfuscate_file(json_input_str: str, local_cache_dir: str = None) -> bytes:
     """
     Obfuscates specified fields in a file stored on S3, supporting CSV, JSON, and Parquet formats.
 
@@ -122,6 +1048,9 @@ def obfuscate_file(json_input_str: str) -> bytes:
         json_input_str (str): A JSON string containing:
             - file_to_obfuscate: S3 URL of the file.
             - pii_fields: List of PII fields to obfuscate.
+        local_cache_dir (str, optional): A directory to download the file into and
+            memory-map it from, rather than holding it in memory. Useful for files
+            too large for the available memory.
 
     Returns:
         bytes: A byte stream of the obfuscated file, ready for use with boto3 S3 PutObject.
@@ -130,35 +1059,56 @@ def obfuscate_file(json_input_str: str) -> bytes:
         ValueError: If the S3 URL is invalid or if the file type is unsupported.
     """
     # Parse the input JSON to extract parameters.
-    input_data = json.loads(json_input_str)
+    input_data = orjson.loads(json_input_str)
     s3_url = input_data["file_to_obfuscate"]
-    pii_fields = input_data["pii_fields"]
+    # Build the set of PII fields once; the helpers reuse it as-is.
+    pii_fields = frozenset(input_data["pii_fields"])
 
-    # Validate the S3 URL format.
-    if not s3_url.startswith("s3://"):
-        raise ValueError("Invalid S3 URL: Must start with 's3://'")
+    # Validate the S3 URL and extract the bucket and key from it.
+    bucket, key = _parse_s3_url(s3_url)
 
-    # Extract the bucket and key from the S3 URL.
-    s3_parts = s3_url[5:].split("/", 1)
-    if len(s3_parts) != 2:
-        raise ValueError("Invalid S3 URL: Must be in the form s3://bucket/key")
-    bucket, key = s3_parts
+    # Determine the file type based on its extension before downloading anything.
+    extension = os.path.splitext(key)[1].lower()
+    handler = _FILE_HANDLERS.get(extension)
+    if handler is None:
+        raise ValueError(
+            "Unsupported file type. Only CSV, JSON, and Parquet are supported."
+        )
 
-    # Initialize an S3 client and retrieve the object.
-    s3 = boto3.client("s3")
-    response = s3.get_object(Bucket=bucket, Key=key)
-    file_bytes = response["Body"].read()
-
-    # Determine the file type based on its extension and call the corresponding function.
-    if key.endswith(".csv"):
-        # Process CSV: decode bytes to string.
-        return obfuscate_csv(file_bytes.decode("utf-8"), pii_fields)
-    if key.endswith(".json"):
-        # Process JSON: decode bytes to string.
-        return obfuscate_json(file_bytes.decode("utf-8"), pii_fields)
-    if key.endswith(".parquet"):
-        # Process Parquet: work directly with bytes.
-        return obfuscate_parquet(file_bytes, pii_fields)
-    raise ValueError(
-        "Unsupported file type. Only CSV, JSON, and Parquet are supported."
+    # Get the shared S3 client, open the object and obfuscate it with the handler.
+    s3 = _get_s3_client()
+    if local_cache_dir is not None:
+        return _obfuscate_cached_object(
+            s3, bucket, key, local_cache_dir, handler, pii_fields
+        )
+    body = _open_s3_object(
+        s3, bucket, key, random_access=extension in _RANDOM_ACCESS_EXTENSIONS
     )
+    return handler(body, pii_fields)
+
+
+def obfuscate_files(
+    json_input_list: list, max_workers: int = DEFAULT_MAX_WORKERS
+) -> list:
+    """
+    Obfuscates several files stored on S3 concurrently.
+
+    Each input is processed by obfuscate_file on a thread pool, so the S3 downloads of
+    different files overlap with each other and with the obfuscation work. The shared
+    boto3 S3 client is thread-safe, and its connection pool is sized for
+    DEFAULT_MAX_WORKERS files each downloading in parallel parts.
+
+    Args:
+        json_input_list (list): JSON strings in the format accepted by obfuscate_file.
+        max_workers (int): The maximum number of files processed at once, capped at
+            DEFAULT_MAX_WORKERS so the workers do not wait on the connection pool.
+
+    Returns:
+        list: The obfuscated files as bytes, in the same order as the inputs.
+
+    Raises:
+        ValueError: If any S3 URL is invalid or any file type is unsupported.
+    """
+    max_workers = min(max_workers, DEFAULT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(obfuscate_file, json_input_list))
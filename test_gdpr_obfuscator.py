@@ -1,7 +1,7 @@
 """
 Test module for the gdpr_obfuscator.
 This module contains tests for CSV, JSON, and Parquet obfuscation functionality,
-using fake S3 client classes to simulate AWS S3 behavior.
+running against an S3 service mocked with moto.
 """
 
 import json
@@ -9,64 +9,61 @@ import csv
 import io
 from io import BytesIO
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
-from gdpr_obfuscator import obfuscate_file
+import boto3
+from moto import mock_aws
+from gdpr_obfuscator import (
+    S3_MAX_POOL_CONNECTIONS,
+    obfuscate_csv_stream,
+    obfuscate_file,
+    obfuscate_files,
+    obfuscate_json,
+)
 
+REGION = "eu-west-2"
 
-# pylint: disable=too-few-public-methods
-class FakeS3Body:
-    """
-    Fake S3 body to simulate the 'Body' attribute of a boto3 S3 object.
 
-    Attributes:
-        data (bytes): The content of the S3 object.
+@pytest.fixture(autouse=True)
+def reset_s3_client(monkeypatch):
+    """
+    Clear the cached S3 client so each test creates one inside its own mocked service.
     """
+    monkeypatch.setattr("gdpr_obfuscator._S3_CLIENT", None)
 
-    def __init__(self, data):
-        # Data should be bytes.
-        self.data = data
 
-    def read(self):
-        """Return the stored bytes."""
-        return self.data
+@pytest.fixture(name="s3")
+def fixture_s3(monkeypatch):
+    """
+    Run the test against a mocked S3 service, yielding a boto3 S3 client for it.
+    """
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", REGION)
+    with mock_aws():
+        yield boto3.client("s3", region_name=REGION)
 
 
-# pylint: disable=too-few-public-methods
-class FakeS3Client:
+def upload(s3, bucket, key, data):
     """
-    Fake S3 client to simulate the boto3 S3 client's get_object method.
+    Create the bucket if needed and upload an object to the mocked S3 service.
 
-    Attributes:
+    Args:
+        s3: The boto3 S3 client for the mocked service.
         bucket (str): The S3 bucket name.
         key (str): The S3 object key.
-        data (bytes): The content of the S3 object.
+        data (bytes): The content of the object.
     """
-
-    def __init__(self, bucket, key, data):
-        self.bucket = bucket
-        self.key = key
-        self.data = data  # bytes
-
-    def get_object(self, Bucket, Key):  # pylint: disable=invalid-name
-        """
-        Simulate boto3 S3 get_object method.
-
-        Args:
-            Bucket (str): The S3 bucket name (intentionally capitalized to mimic boto3).
-            Key (str): The S3 key (intentionally capitalized to mimic boto3).
-
-        Returns:
-            dict: A dictionary with a 'Body' key containing a FakeS3Body.
-
-        Raises:
-            ValueError: If the bucket/key do not match the expected values.
-        """
-        if Bucket == self.bucket and Key == self.key:
-            return {"Body": FakeS3Body(self.data)}
-        raise ValueError("Object not found")
+    if bucket not in {b["Name"] for b in s3.list_buckets()["Buckets"]}:
+        s3.create_bucket(
+            Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": REGION}
+        )
+    s3.put_object(Bucket=bucket, Key=key, Body=data)
 
 
-def test_obfuscate_csv(monkeypatch):
+def test_obfuscate_csv(s3):
     """
     Test that obfuscate_file correctly obfuscates specified fields in a CSV file.
     """
@@ -82,9 +79,8 @@ def test_obfuscate_csv(monkeypatch):
         {"file_to_obfuscate": s3_url, "pii_fields": ["name", "email_address"]}
     )
 
-    # Create a fake S3 client with the CSV content.
-    fake_s3_client = FakeS3Client(bucket, key, csv_content.encode("utf-8"))
-    monkeypatch.setattr("gdpr_obfuscator.boto3.client", lambda service: fake_s3_client)
+    # Upload the CSV content to the mocked S3 bucket.
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
 
     output_bytes = obfuscate_file(input_json)
     output_str = output_bytes.decode("utf-8")
@@ -104,7 +100,78 @@ def test_obfuscate_csv(monkeypatch):
         assert row["email_address"] == "***"
 
 
-def test_no_pii(monkeypatch):
+def test_obfuscate_large_csv(s3, monkeypatch):
+    """
+    Test that obfuscate_file obfuscates a CSV file large enough to be downloaded in parallel.
+    """
+    csv_content = "id,name\n1,John Smith\n"
+    bucket = "bucket"
+    key = "large.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
+    monkeypatch.setattr("gdpr_obfuscator.PARALLEL_DOWNLOAD_THRESHOLD", 1)
+
+    output_bytes = obfuscate_file(input_json)
+    output_str = output_bytes.decode("utf-8")
+
+    assert "John Smith" not in output_str
+    reader = csv.DictReader(io.StringIO(output_str))
+    for row in reader:
+        assert row["id"] == "1"
+        assert row["name"] == "***"
+    # Verify that Arrow writes the rows unquoted, exactly as they were read.
+    assert output_bytes == b"id,name\n1,***\n"
+
+
+def test_obfuscate_csv_same_output_for_all_paths(s3, monkeypatch, tmp_path):
+    """
+    Test that obfuscate_file gives the same CSV output whichever way the file is read.
+    """
+    contents = [
+        b"id,name,city\n1,John Smith,Leeds\n2,Jane Doe,York\n",
+        b'id,name,city\r\n1,John Smith,Leeds\r\n\r\n2,"Doe, Jane","a ""b"""\r\n',
+    ]
+    bucket = "bucket"
+    key = "file.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    for csv_content in contents:
+        upload(s3, bucket, key, csv_content)
+
+        streamed = obfuscate_file(input_json)
+        cached = obfuscate_file(input_json, local_cache_dir=str(tmp_path))
+        with monkeypatch.context() as patch:
+            patch.setattr("gdpr_obfuscator.PARALLEL_DOWNLOAD_THRESHOLD", 1)
+            downloaded = obfuscate_file(input_json)
+
+        assert b"John Smith" not in streamed
+        assert streamed == cached == downloaded
+
+
+def test_obfuscate_csv_local_cache_dir(s3, tmp_path):
+    """
+    Test that obfuscate_file obfuscates a CSV file memory-mapped from a local cache file.
+    """
+    csv_content = 'id,name\n1,John Smith\n2,"Doe, Jane"\n'
+    bucket = "bucket"
+    key = "file.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
+
+    output_bytes = obfuscate_file(input_json, local_cache_dir=str(tmp_path))
+    rows = list(csv.reader(io.StringIO(output_bytes.decode("utf-8"))))
+
+    assert rows == [["id", "name"], ["1", "***"], ["2", "***"]]
+    # Verify that the cache file has been removed.
+    assert not list(tmp_path.iterdir())
+
+
+def test_no_pii(s3):
     """
     Test that obfuscate_file leaves CSV data unchanged when no PII fields are provided.
     """
@@ -114,8 +181,7 @@ def test_no_pii(monkeypatch):
     s3_url = f"s3://{bucket}/{key}"
     input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": []})
 
-    fake_s3_client = FakeS3Client(bucket, key, csv_content.encode("utf-8"))
-    monkeypatch.setattr("gdpr_obfuscator.boto3.client", lambda service: fake_s3_client)
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
 
     output_bytes = obfuscate_file(input_json)
     output_str = output_bytes.decode("utf-8")
@@ -127,7 +193,7 @@ def test_no_pii(monkeypatch):
         assert row["info"] == "some data"
 
 
-def test_no_matching_fields(monkeypatch):
+def test_no_matching_fields(s3):
     """
     Test that obfuscate_file leaves CSV data unchanged when provided PII fields do not exist.
     """
@@ -139,8 +205,7 @@ def test_no_matching_fields(monkeypatch):
         {"file_to_obfuscate": s3_url, "pii_fields": ["non_existent_field"]}
     )
 
-    fake_s3_client = FakeS3Client(bucket, key, csv_content.encode("utf-8"))
-    monkeypatch.setattr("gdpr_obfuscator.boto3.client", lambda service: fake_s3_client)
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
 
     output_bytes = obfuscate_file(input_json)
     output_str = output_bytes.decode("utf-8")
@@ -152,6 +217,50 @@ def test_no_matching_fields(monkeypatch):
         assert row["info"] == "some data"
 
 
+def test_s3_client_reused(s3, monkeypatch):
+    """
+    Test that obfuscate_file creates the S3 client once and reuses it across calls.
+    """
+    csv_content = "id,info\n1,some data\n"
+    bucket = "bucket"
+    key = "file.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["info"]})
+
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
+
+    created = []
+    real_client = boto3.client
+
+    def counting_client(service, config=None):
+        created.append((service, config.max_pool_connections))
+        return real_client(service, config=config)
+
+    monkeypatch.setattr("gdpr_obfuscator.boto3.client", counting_client)
+
+    obfuscate_file(input_json)
+    obfuscate_file(input_json)
+
+    assert created == [("s3", S3_MAX_POOL_CONNECTIONS)]
+
+
+def test_no_matching_fields_returns_original(s3):
+    """
+    Test that obfuscate_file returns a CSV file byte for byte when no field matches.
+    """
+    csv_content = b'id,info\n1,"some, data"\n'
+    bucket = "bucket"
+    key = "file.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps(
+        {"file_to_obfuscate": s3_url, "pii_fields": ["non_existent_field"]}
+    )
+
+    upload(s3, bucket, key, csv_content)
+
+    assert obfuscate_file(input_json) == csv_content
+
+
 def test_invalid_s3_url():
     """
     Test that obfuscate_file raises a ValueError when an invalid S3 URL is provided.
@@ -165,7 +274,7 @@ def test_invalid_s3_url():
     assert "Invalid S3 URL" in str(excinfo.value)
 
 
-def test_empty_csv(monkeypatch):
+def test_empty_csv(s3):
     """
     Test that obfuscate_file handles a CSV file with only a header row correctly.
     """
@@ -176,8 +285,7 @@ def test_empty_csv(monkeypatch):
     s3_url = f"s3://{bucket}/{key}"
     input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
 
-    fake_s3_client = FakeS3Client(bucket, key, csv_content.encode("utf-8"))
-    monkeypatch.setattr("gdpr_obfuscator.boto3.client", lambda service: fake_s3_client)
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
 
     output_bytes = obfuscate_file(input_json)
     output_str = output_bytes.decode("utf-8")
@@ -189,7 +297,145 @@ def test_empty_csv(monkeypatch):
     assert len(rows) == 0
 
 
-def test_obfuscate_json(monkeypatch):
+def test_zero_byte_csv(s3):
+    """
+    Test that obfuscate_file raises a ValueError for a CSV file with no header row.
+    """
+    bucket = "bucket"
+    key = "zero.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, b"")
+
+    with pytest.raises(ValueError) as excinfo:
+        obfuscate_file(input_json)
+    assert "no header row" in str(excinfo.value)
+
+
+def test_blank_first_line_csv(s3):
+    """
+    Test that obfuscate_file raises a ValueError for a CSV file whose first line is blank.
+    """
+    bucket = "bucket"
+    key = "blank.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    for csv_content in (
+        b"\nid,name\n1,John Smith\n",
+        b"\r\nid,name\r\n1,John Smith\r\n",
+        b"\rid,name\n1,John Smith\n",
+    ):
+        upload(s3, bucket, key, csv_content)
+        with pytest.raises(ValueError) as excinfo:
+            obfuscate_file(input_json)
+        assert "no header row" in str(excinfo.value)
+        with pytest.raises(ValueError):
+            obfuscate_csv_stream(BytesIO(csv_content), ["name"])
+
+
+def test_obfuscate_csv_quoted_fields(s3):
+    """
+    Test that obfuscate_file handles quoted fields containing delimiters and newlines.
+    """
+    csv_content = (
+        "id,name,notes\n"
+        "1,John Smith,plain\n"
+        '2,"Doe, Jane","line one\nline two"\n'
+        "3,Ann Lee,plain\n"
+    )
+    bucket = "bucket"
+    key = "quoted.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
+
+    output_bytes = obfuscate_file(input_json)
+    output_str = output_bytes.decode("utf-8")
+
+    rows = list(csv.reader(io.StringIO(output_str)))
+    assert rows == [
+        ["id", "name", "notes"],
+        ["1", "***", "plain"],
+        ["2", "***", "line one\nline two"],
+        ["3", "***", "plain"],
+    ]
+
+
+def test_obfuscate_csv_multiline_header(s3):
+    """
+    Test that obfuscate_file keeps the line endings of a CSV file with a multi-line header.
+    """
+    csv_content = b'id,"na\nme",x\n1,John,a\n'
+    bucket = "bucket"
+    key = "header.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["na\nme"]})
+
+    upload(s3, bucket, key, csv_content)
+
+    assert obfuscate_file(input_json) == b'id,"na\nme",x\n1,***,a\n'
+
+
+def test_obfuscate_csv_ragged_rows(s3):
+    """
+    Test that obfuscate_file obfuscates a CSV file whose rows have differing field counts.
+    """
+    csv_content = "id,name,email\n1,John Smith\n2,Jane Doe,jane@example.com\n"
+    bucket = "bucket"
+    key = "ragged.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps(
+        {"file_to_obfuscate": s3_url, "pii_fields": ["name", "email"]}
+    )
+
+    upload(s3, bucket, key, csv_content.encode("utf-8"))
+
+    output_bytes = obfuscate_file(input_json)
+    output_str = output_bytes.decode("utf-8")
+
+    # Verify that PII fields present in each row have been obfuscated.
+    rows = list(csv.reader(io.StringIO(output_str)))
+    assert rows[0] == ["id", "name", "email"]
+    assert rows[1] == ["1", "***"]
+    assert rows[2] == ["2", "***", "***"]
+
+
+def test_obfuscate_csv_bare_carriage_return(s3, monkeypatch, tmp_path):
+    """
+    Test that obfuscate_file treats a bare carriage return as the end of a CSV row, and
+    keeps one inside a quoted field quoted.
+    """
+    expected = {
+        b"id,name,email\n1,John,j@x.com\r2,Jane Doe,jd@x.com\n": (
+            b"id,name,email\n1,***,***\n2,***,***\n"
+        ),
+        b'id,name,email\n1,John,"a\rb"\n': b"id,name,email\n1,***,***\n",
+        b'id,name,notes\n1,John,"a\rb"\n': b'id,name,notes\n"1","***","a\rb"\n',
+    }
+    bucket = "bucket"
+    key = "file.csv"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps(
+        {"file_to_obfuscate": s3_url, "pii_fields": ["name", "email"]}
+    )
+
+    for csv_content, obfuscated in expected.items():
+        upload(s3, bucket, key, csv_content)
+
+        streamed = obfuscate_file(input_json)
+        cached = obfuscate_file(input_json, local_cache_dir=str(tmp_path))
+        with monkeypatch.context() as patch:
+            patch.setattr("gdpr_obfuscator.PARALLEL_DOWNLOAD_THRESHOLD", 1)
+            downloaded = obfuscate_file(input_json)
+
+        assert streamed == obfuscated
+        assert streamed == cached == downloaded
+
+
+def test_obfuscate_json(s3):
     """
     Test that obfuscate_file correctly obfuscates specified fields in a JSON file.
     """
@@ -205,8 +451,7 @@ def test_obfuscate_json(monkeypatch):
         {"file_to_obfuscate": s3_url, "pii_fields": ["name", "email"]}
     )
 
-    fake_s3_client = FakeS3Client(bucket, key, json_content.encode("utf-8"))
-    monkeypatch.setattr("gdpr_obfuscator.boto3.client", lambda service: fake_s3_client)
+    upload(s3, bucket, key, json_content.encode("utf-8"))
 
     output_bytes = obfuscate_file(input_json)
     output_text = output_bytes.decode("utf-8")
@@ -217,7 +462,104 @@ def test_obfuscate_json(monkeypatch):
         assert item["email"] == "***"
 
 
-def test_obfuscate_parquet(monkeypatch):
+def test_obfuscate_json_preserves_other_values(s3):
+    """
+    Test that obfuscate_file leaves non-PII values of any JSON type unchanged.
+    """
+    data = [
+        {"id": 1, "name": "John Smith", "score": 1.5, "tags": ["a", "b"]},
+        {"id": 2, "name": "Jane Doe", "score": None, "address": {"city": "Leeds"}},
+    ]
+    bucket = "bucket"
+    key = "data/file.json"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, json.dumps(data).encode("utf-8"))
+
+    result_data = json.loads(obfuscate_file(input_json))
+
+    for item in data:
+        item["name"] = "***"
+    assert result_data == data
+
+
+def test_obfuscate_json_big_integers_stream(s3):
+    """
+    Test that obfuscate_file keeps integers wider than 64 bits in a JSON file exactly.
+    """
+    json_content = b'[{"id": 123456789012345678901234, "score": 1.5, "name": "x"}]'
+    bucket = "bucket"
+    key = "data/file.json"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, json_content)
+
+    result_data = json.loads(obfuscate_file(input_json))
+
+    assert result_data == [
+        {"id": 123456789012345678901234, "score": 1.5, "name": "***"}
+    ]
+
+
+def test_obfuscate_json_not_a_list(s3):
+    """
+    Test that obfuscate_file raises a ValueError for JSON that is not a list of objects.
+    """
+    bucket = "bucket"
+    key = "data/file.json"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    for json_content in (b'{"name": "John Smith"}', b'["John Smith"]'):
+        upload(s3, bucket, key, json_content)
+
+        with pytest.raises(ValueError) as excinfo:
+            obfuscate_file(input_json)
+        assert "list of objects" in str(excinfo.value)
+
+
+def test_obfuscate_json_invalid(s3):
+    """
+    Test that obfuscate_file raises a ValueError for malformed or out-of-range JSON.
+    """
+    bucket = "bucket"
+    key = "data/file.json"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    for json_content in (b'[{"name": "John Smith"},]', b'[{"name": "J", "n": 1e400}]'):
+        upload(s3, bucket, key, json_content)
+
+        with pytest.raises(ValueError):
+            obfuscate_file(input_json)
+
+
+def test_obfuscate_json_big_integers():
+    """
+    Test that obfuscate_json keeps integers wider than 64 bits exactly.
+    """
+    data = b'[{"id":123456789012345678901234,"low":-9223372036854775809,"name":"x"}]'
+
+    output_bytes = obfuscate_json(data, ["name"])
+
+    assert json.loads(output_bytes) == [
+        {"id": 123456789012345678901234, "low": -9223372036854775809, "name": "***"}
+    ]
+
+
+def test_obfuscate_json_in_memory_not_a_list():
+    """
+    Test that obfuscate_json raises a ValueError for JSON that is not a list of objects.
+    """
+    for data in (b"[null]", b"[[1]]", b'{"name": "John Smith"}'):
+        with pytest.raises(ValueError) as excinfo:
+            obfuscate_json(data, ["name"])
+        assert "list of objects" in str(excinfo.value)
+
+
+def test_obfuscate_parquet(s3):
     """
     Test that obfuscate_file correctly obfuscates specified fields in a Parquet file.
     """
@@ -241,8 +583,7 @@ def test_obfuscate_parquet(monkeypatch):
         {"file_to_obfuscate": s3_url, "pii_fields": ["name", "email"]}
     )
 
-    fake_s3_client = FakeS3Client(bucket, key, parquet_content)
-    monkeypatch.setattr("gdpr_obfuscator.boto3.client", lambda service: fake_s3_client)
+    upload(s3, bucket, key, parquet_content)
 
     output_bytes = obfuscate_file(input_json)
     result_df = pd.read_parquet(BytesIO(output_bytes))
@@ -254,7 +595,98 @@ def test_obfuscate_parquet(monkeypatch):
     assert all(result_df["other"] == df["other"])
 
 
-def test_unsupported_file_type(monkeypatch):
+def test_obfuscate_parquet_preserves_layout(s3):
+    """
+    Test that obfuscate_file keeps the row groups and compression of a Parquet file.
+    """
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["John Smith", "Jane Doe", "Ann Lee"]})
+    buffer = BytesIO()
+    df.to_parquet(buffer, index=False, compression="gzip", row_group_size=2)
+
+    bucket = "bucket"
+    key = "data/file.parquet"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, buffer.getvalue())
+
+    output_bytes = obfuscate_file(input_json)
+    metadata = pq.read_metadata(BytesIO(output_bytes))
+    result_df = pd.read_parquet(BytesIO(output_bytes))
+
+    assert metadata.num_row_groups == 2
+    for rg in range(metadata.num_row_groups):
+        for col in range(metadata.num_columns):
+            assert metadata.row_group(rg).column(col).compression == "GZIP"
+    assert all(result_df["name"] == "***")
+    assert all(result_df["id"] == df["id"])
+
+
+def test_obfuscate_large_parquet(s3, monkeypatch):
+    """
+    Test that obfuscate_file reads a large Parquet file through PyArrow's S3 filesystem.
+    """
+    df = pd.DataFrame({"id": [1, 2], "name": ["John Smith", "Jane Doe"]})
+    buffer = BytesIO()
+    df.to_parquet(buffer, index=False)
+
+    bucket = "bucket"
+    key = "data/file.parquet"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    opened = []
+
+    # pylint: disable=too-few-public-methods
+    class FakeS3FileSystem:
+        """Fake PyArrow S3 filesystem serving the Parquet file from memory."""
+
+        def __init__(self, **options):
+            # Verify that the filesystem is configured like the boto3 client.
+            credentials = boto3.Session().get_credentials().get_frozen_credentials()
+            assert options == {
+                "region": REGION,
+                "access_key": credentials.access_key,
+                "secret_key": credentials.secret_key,
+                "session_token": credentials.token,
+            }
+
+        def open_input_file(self, path):
+            """Return the file content as a random-access PyArrow file."""
+            opened.append(path)
+            return pa.BufferReader(buffer.getvalue())
+
+    upload(s3, bucket, key, buffer.getvalue())
+    monkeypatch.setattr("gdpr_obfuscator.PARALLEL_DOWNLOAD_THRESHOLD", 1)
+    monkeypatch.setattr("gdpr_obfuscator.pa_fs.S3FileSystem", FakeS3FileSystem)
+
+    result_df = pd.read_parquet(BytesIO(obfuscate_file(input_json)))
+
+    assert opened == [f"{bucket}/{key}"]
+    assert all(result_df["name"] == "***")
+    assert all(result_df["id"] == df["id"])
+
+
+def test_obfuscate_parquet_already_obfuscated(s3):
+    """
+    Test that obfuscate_file returns an already obfuscated Parquet file unchanged.
+    """
+    df = pd.DataFrame({"id": [1, 2], "name": ["***", "***"]})
+    buffer = BytesIO()
+    df.to_parquet(buffer, index=False)
+    parquet_content = buffer.getvalue()
+
+    bucket = "bucket"
+    key = "data/file.parquet"
+    s3_url = f"s3://{bucket}/{key}"
+    input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["name"]})
+
+    upload(s3, bucket, key, parquet_content)
+
+    assert obfuscate_file(input_json) == parquet_content
+
+
+def test_unsupported_file_type(s3):
     """
     Test that obfuscate_file raises a ValueError for unsupported file types.
     """
@@ -263,9 +695,36 @@ def test_unsupported_file_type(monkeypatch):
     s3_url = f"s3://{bucket}/{key}"
     input_json = json.dumps({"file_to_obfuscate": s3_url, "pii_fields": ["field"]})
 
-    fake_s3_client = FakeS3Client(bucket, key, b"some content")
-    monkeypatch.setattr("gdpr_obfuscator.boto3.client", lambda service: fake_s3_client)
+    upload(s3, bucket, key, b"some content")
 
     with pytest.raises(ValueError) as excinfo:
         obfuscate_file(input_json)
     assert "Unsupported file type" in str(excinfo.value)
+
+
+def test_obfuscate_files(s3):
+    """
+    Test that obfuscate_files obfuscates several files and returns them in input order.
+    """
+    bucket = "bucket"
+    files = {
+        "a.csv": "id,name\n1,John Smith\n",
+        "b.csv": "id,name\n2,Jane Doe\n",
+        "c.csv": "id,name\n3,Ann Lee\n",
+    }
+
+    for key, content in files.items():
+        upload(s3, bucket, key, content.encode("utf-8"))
+
+    input_jsons = [
+        json.dumps(
+            {"file_to_obfuscate": f"s3://{bucket}/{key}", "pii_fields": ["name"]}
+        )
+        for key in files
+    ]
+    outputs = obfuscate_files(input_jsons, max_workers=3)
+
+    assert len(outputs) == 3
+    for expected_id, output_bytes in zip(["1", "2", "3"], outputs):
+        rows = list(csv.DictReader(io.StringIO(output_bytes.decode("utf-8"))))
+        assert rows == [{"id": expected_id, "name": "***"}]